@@ -3,20 +3,78 @@ from __future__ import annotations
 import datetime as _dt
 import logging
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 
 _LOGGER = logging.getLogger(__name__)
 
+_UTC = _dt.timezone.utc
+
+
+class Status(IntEnum):
+    """Simplified deployment status buckets; small ints so they can index tables and bitmasks."""
+
+    READY = 0
+    BUILDING = 1
+    ERROR = 2
+    UNKNOWN = 3
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+# Map the many possible ready states to simplified buckets for the tray icon
+_STATUS_MAP: Dict[str, Status] = {
+    "ready": Status.READY,
+    "building": Status.BUILDING,
+    "queued": Status.BUILDING,
+    "initializing": Status.BUILDING,
+    "error": Status.ERROR,
+    "failed": Status.ERROR,
+    "canceled": Status.ERROR,
+    "cancelled": Status.ERROR,
+}
+
+# Provider-specific meta keys per field, in order of preference (GitHub/GitLab/Bitbucket/generic)
+_GIT_KEYS: Dict[str, Tuple[str, ...]] = {
+    "branch": ("githubCommitRef", "gitlabCommitRef", "bitbucketCommitRef", "branch", "commitRef"),
+    "sha": ("githubCommitSha", "gitlabCommitSha", "bitbucketCommitSha", "commitSha", "sha"),
+    "message": (
+        "githubCommitMessage",
+        "gitlabCommitMessage",
+        "bitbucketCommitMessage",
+        "commitMessage",
+    ),
+    "author": (
+        "githubCommitAuthorName",
+        "gitlabCommitAuthorName",
+        "bitbucketCommitAuthorName",
+        "commitAuthorName",
+    ),
+}
+
+
+def _first_meta(meta: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    return next((meta[k] for k in keys if meta.get(k)), "")
+
 
 @dataclass
 class Deployment:
     id: str
     name: str
     url: str
-    status: str  # one of: ready, building, error, queued, canceled, unknown
+    status: Status
     created_at: _dt.datetime
     # Extra metadata to improve menu rendering
     branch: str = ""
@@ -40,11 +98,32 @@ class VercelClient:
         self.token = token.strip()
         self.team_id = (team_id or "").strip() or None
         self.session = requests.Session()
+        # Only api.vercel.com is ever contacted: keep the pool tiny and retry
+        # transient gateway errors instead of surfacing them as failed refreshes.
+        # Read timeouts aren't retried and Retry-After is ignored, so a failing
+        # poll can't stall the single refresh worker for long. GET is retried
+        # by urllib3 by default (no allowed_methods: it needs urllib3 >= 1.26).
+        retry = Retry(
+            total=2,
+            connect=2,
+            read=0,
+            status=2,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            respect_retry_after_header=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retry)
+        self.session.mount("https://", adapter)
         self.timeout_s = timeout_s
         self.base_url_candidates = [
             "https://api.vercel.com/v13",  # new
             "https://api.vercel.com/v6",  # legacy
         ]
+        # Base URL that last answered successfully; tried first on the next poll
+        self._preferred_base: Optional[str] = None
+        # Conditional GET state: ETag of the last good response and its parsed result
+        self._last_etag: Optional[str] = None
+        self._last_deployments: List[Deployment] = []
 
     def _headers(self) -> Dict[str, str]:
         return {"Authorization": f"Bearer {self.token}"}
@@ -55,20 +134,35 @@ class VercelClient:
             params["teamId"] = self.team_id
 
         last_error: Optional[Exception] = None
-        for base in self.base_url_candidates:
+        bases = [self._preferred_base] if self._preferred_base else []
+        bases += [b for b in self.base_url_candidates if b != self._preferred_base]
+        for base in bases:
             url = f"{base}/deployments"
+            headers = self._headers()
+            # Only the base that produced the ETag can validate it
+            if self._last_etag and base == self._preferred_base:
+                headers["If-None-Match"] = self._last_etag
             try:
-                res = self.session.get(url, headers=self._headers(), params=params, timeout=self.timeout_s)
+                res = self.session.get(url, headers=headers, params=params, timeout=self.timeout_s)
                 if res.status_code == 401:
                     raise PermissionError("Unauthorized. Check Vercel API token and team scope.")
+                if res.status_code == 304 and "If-None-Match" in headers:
+                    # Unchanged since last poll: hand back the same list object
+                    return self._last_deployments
                 res.raise_for_status()
-                data = res.json() or {}
+                # Parse raw bytes directly; skips requests' charset detection
+                data = (_json.loads(res.content) if res.content else None) or {}
                 deployments_raw = data.get("deployments") or data  # v6 may return list directly
                 parsed = [self._parse_deployment(item) for item in deployments_raw]
                 parsed.sort(key=lambda d: d.created_at, reverse=True)
-                return parsed[: limit]
+                self._preferred_base = base
+                self._last_etag = res.headers.get("ETag")
+                self._last_deployments = parsed[: limit]
+                return self._last_deployments
             except Exception as exc:  # meaningful handling: try next base or bubble up
                 last_error = exc
+                if base == self._preferred_base:
+                    self._preferred_base = None
                 _LOGGER.debug("list_deployments failed via %s: %s", base, exc)
                 continue
         if last_error:
@@ -80,21 +174,15 @@ class VercelClient:
         name = str(raw.get("name") or raw.get("project", {}).get("name") or "")
         url = str(raw.get("url") or raw.get("inspectorUrl") or "")
         created = raw.get("createdAt") or raw.get("created_at") or 0
-        created_at = _dt.datetime.fromtimestamp(int(created) / 1000, tz=_dt.timezone.utc) if created else _dt.datetime.now(tz=_dt.timezone.utc)
+        if created and not isinstance(created, (int, float)):
+            created = int(created)
+        if created:
+            created_at = _dt.datetime.fromtimestamp(created / 1000, tz=_UTC)
+        else:
+            created_at = _dt.datetime.now(tz=_UTC)
 
         ready_state = (raw.get("readyState") or raw.get("state") or "").lower()
-        # Map the many possible ready states to simplified buckets for the tray icon
-        status_map = {
-            "ready": "ready",
-            "building": "building",
-            "queued": "building",
-            "initializing": "building",
-            "error": "error",
-            "failed": "error",
-            "canceled": "error",
-            "cancelled": "error",
-        }
-        status = status_map.get(ready_state, "unknown")
+        status = _STATUS_MAP.get(ready_state, Status.UNKNOWN)
 
         # Extract git metadata in a provider-agnostic way (GitHub/GitLab/Bitbucket)
         branch, sha, message, author = self._extract_git_meta(raw)
@@ -121,43 +209,11 @@ class VercelClient:
         """
         meta = raw.get("meta") or {}
 
-        # Branch
-        branch = (
-            meta.get("githubCommitRef")
-            or meta.get("gitlabCommitRef")
-            or meta.get("bitbucketCommitRef")
-            or meta.get("branch")
-            or meta.get("commitRef")
-            or ""
-        )
-
-        # Commit SHA
-        sha = (
-            meta.get("githubCommitSha")
-            or meta.get("gitlabCommitSha")
-            or meta.get("bitbucketCommitSha")
-            or meta.get("commitSha")
-            or meta.get("sha")
-            or ""
-        )
-
-        # Commit message
-        message = (
-            meta.get("githubCommitMessage")
-            or meta.get("gitlabCommitMessage")
-            or meta.get("bitbucketCommitMessage")
-            or meta.get("commitMessage")
-            or ""
-        )
-
+        branch = _first_meta(meta, _GIT_KEYS["branch"])
+        sha = _first_meta(meta, _GIT_KEYS["sha"])
+        message = _first_meta(meta, _GIT_KEYS["message"])
         # Author (prefer commit author; fallback to creator info)
-        author = (
-            meta.get("githubCommitAuthorName")
-            or meta.get("gitlabCommitAuthorName")
-            or meta.get("bitbucketCommitAuthorName")
-            or meta.get("commitAuthorName")
-            or ""
-        )
+        author = _first_meta(meta, _GIT_KEYS["author"])
         creator = raw.get("creator") or {}
         if not author:
             author = creator.get("name") or creator.get("username") or creator.get("email") or ""
@@ -4,7 +4,7 @@ import json
 import os
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 
 CONFIG_DIRNAME = "vercel-deployments"
@@ -28,6 +28,13 @@ class AppConfig:
     notify_prod_events: bool = True
 
 
+_DEFAULTS: Dict[str, object] = asdict(AppConfig())
+
+# Parsed config memoized by file mtime; refreshed by save_config()
+_CACHE: Optional[Dict[str, object]] = None
+_CACHE_MTIME: Optional[float] = None
+
+
 def _config_dir() -> Path:
     xdg = os.environ.get("XDG_CONFIG_HOME")
     base = Path(xdg) if xdg else Path.home() / ".config"
@@ -41,22 +48,30 @@ def _config_path() -> Path:
 
 
 def load_config() -> Dict[str, object]:
+    global _CACHE, _CACHE_MTIME
     p = _config_path()
-    if not p.exists():
-        return asdict(AppConfig())
+    try:
+        mtime = os.stat(p).st_mtime
+    except OSError:
+        return dict(_DEFAULTS)
+    if _CACHE is not None and mtime == _CACHE_MTIME:
+        # Defensive copy so callers can't mutate the cached dict
+        return dict(_CACHE)
     try:
         data = json.loads(p.read_text(encoding="utf-8"))
         # Provide defaults for any missing keys
-        defaults = asdict(AppConfig())
-        for k, v in defaults.items():
+        for k, v in _DEFAULTS.items():
             data.setdefault(k, v)
-        return data
     except Exception:
         # Corrupted file: return defaults
-        return asdict(AppConfig())
+        return dict(_DEFAULTS)
+    _CACHE = data
+    _CACHE_MTIME = mtime
+    return dict(data)
 
 
-def save_config(data: Dict[str, object]) -> None:
+def save_config(data: Dict[str, object]) -> Dict[str, object]:
+    global _CACHE, _CACHE_MTIME
     # Enforce expected keys and simple types
     cfg = AppConfig(
         token=str(data.get("token") or ""),
@@ -67,12 +82,31 @@ def save_config(data: Dict[str, object]) -> None:
         notify_prod_events=bool(data.get("notify_prod_events")) if data.get("notify_prod_events") is not None else True,
     )
     p = _config_path()
-    txt = json.dumps(asdict(cfg), ensure_ascii=False, indent=2)
-    p.write_text(txt, encoding="utf-8")
+    txt = json.dumps(asdict(cfg), ensure_ascii=False, separators=(",", ":"))
+    # Write to a private temp file and swap it in, so the token is never
+    # world-readable and a crash mid-write can't corrupt the config
+    tmp = p.with_suffix(p.suffix + ".tmp")
+    # A leftover temp file may carry looser permissions; O_EXCL guarantees a fresh 0600 file
     try:
-        os.chmod(p, 0o600)
-    except Exception:
-        # Non-fatal on platforms without chmod
+        os.unlink(tmp)
+    except FileNotFoundError:
         pass
+    fd = os.open(tmp, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(txt)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, p)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    _CACHE = asdict(cfg)
+    _CACHE_MTIME = os.stat(p).st_mtime
+    # Hand back the normalized config so callers don't need to re-load it
+    return dict(_CACHE)
 
 
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import datetime as _dt
+import functools
+import queue
 import threading
 import webbrowser
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -18,13 +22,34 @@ except (ImportError, ValueError):
     gi.require_version("AppIndicator3", "0.1")
     from gi.repository import AppIndicator3
 
-from .api import Deployment, VercelClient
+from .api import Deployment, Status, VercelClient
 from .config import load_config, save_config
 from .preferences import PreferencesDialog
 
 
 APPINDICATOR_ID = "vercel-deployments"
 
+# Indexed by Status value
+_STATUS_EMOJI = ("✅", "🟡", "❌", "🟡")
+
+# Above this many production changes in one refresh, send a single summary notification
+_MAX_PROD_NOTIFICATIONS = 3
+
+# Idle backoff: the poll interval doubles up to 2**_MAX_BACKOFF_STEPS, capped in seconds
+_MAX_BACKOFF_STEPS = 4
+_MAX_BACKOFF_INTERVAL = 300
+
+
+@dataclass
+class _RowWidgets:
+    """Persistent widgets for one deployment row, plus what they currently show."""
+
+    menu_item: Gtk.MenuItem
+    label: Gtk.Label
+    submenu: Gtk.Menu
+    deployment: Optional[Deployment] = None
+    compact_text: str = ""
+
 
 class VercelIndicator:
     """GNOME AppIndicator showing Vercel deployment status and quick links."""
@@ -41,10 +66,18 @@ class VercelIndicator:
         self.indicator.set_menu(self.menu)
 
         self._refresh_timer_id: Optional[int] = None
+        self._refresh_timer_interval: Optional[int] = None
+        self._consecutive_unchanged = 0
         self._refresh_in_progress = False
         self._last_overall_status: Optional[str] = None
-        self._prod_seen: Dict[str, str] = {}
+        self._prod_seen: Dict[str, Status] = {}
         self._prod_seen_bootstrapped: bool = False
+        # Pooled deployment rows; grows up to max_items and is reused across refreshes
+        self._row_pool: List[_RowWidgets] = []
+        # Single long-lived worker; maxsize=1 coalesces bursts of refresh requests
+        self._refresh_q: "queue.Queue[Optional[bool]]" = queue.Queue(maxsize=1)
+        self._worker = threading.Thread(target=self._refresh_worker, daemon=True)
+        self._worker.start()
 
         self._reconfigure()
         self._build_static_menu()
@@ -57,8 +90,9 @@ class VercelIndicator:
             self._schedule_refresh(immediate=True)
 
     # -------- Configuration / Preferences --------
-    def _reconfigure(self) -> None:
-        cfg = load_config()
+    def _reconfigure(self, cfg: Optional[Dict[str, object]] = None) -> None:
+        if cfg is None:
+            cfg = load_config()
         self.refresh_interval = int(cfg.get("refresh_interval") or 30)
         self.max_items = int(cfg.get("max_items") or 10)
         token = str(cfg.get("token") or "")
@@ -72,9 +106,10 @@ class VercelIndicator:
         dialog.set_modal(True)
         dialog.present()
 
-    def _on_prefs_saved(self) -> None:
-        # Re-read config and restart refresh loop
-        self._reconfigure()
+    def _on_prefs_saved(self, cfg: Dict[str, object]) -> None:
+        # Apply the just-saved config and restart refresh loop
+        self._reconfigure(cfg)
+        self._consecutive_unchanged = 0
         self._schedule_refresh(immediate=True)
 
     # -------- Menu construction --------
@@ -82,10 +117,7 @@ class VercelIndicator:
         for child in list(self.menu.get_children()):
             self.menu.remove(child)
 
-        # Dynamic section will be inserted before the separator
-        self.dynamic_section = Gtk.Menu()
-
-        # We'll rebuild dynamic items directly on self.menu (no submenus)
+        # Deployment rows are inserted directly on self.menu, right after the header
         header = Gtk.MenuItem(label="Vercel Deployments")
         header.set_sensitive(False)
         self.menu.append(header)
@@ -111,103 +143,133 @@ class VercelIndicator:
         self.menu.show_all()
 
     def _rebuild_dynamic_items(self, deployments: List[Deployment]) -> None:
-        # Remove any previous dynamic items (between header and first separator)
-        children = self.menu.get_children()
-        # header at index 0, separator at index 1 currently; dynamic items go from 1..(before first separator we appended later)
-        # We will rebuild all items and re-add separators accordingly for simplicity.
-        self._build_static_menu()
-
-        insert_index = 1  # after header
-        for dep in deployments[: self.max_items]:
-            # Visual status hint using emoji for quick scanning
-            status_emoji = {
-                "ready": "✅",
-                "building": "🟡",
-                "error": "❌",
-            }.get(dep.status, "🟡")
-
-            branch = dep.branch or "?"
-            short_sha = dep.commit_sha[:7] if dep.commit_sha else ""
-            author = dep.author or ""
-            target = dep.target or ""
-
-            primary = dep.name or "(unknown)"
-            when = self._humanize_time(dep.created_at)
-            
-            # Create main menu item with compact info
-            main_item = Gtk.MenuItem()
-            main_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-            main_row.set_margin_start(6)
-            main_row.set_margin_end(6)
-            main_row.set_margin_top(2)
-            main_row.set_margin_bottom(2)
-            
-            # Compact label: status + project + author + time
-            compact_text = f"{status_emoji} {primary} · {author} · {when}"
-            compact_label = Gtk.Label(label=compact_text)
-            compact_label.set_xalign(0)
-            compact_label.set_ellipsize(Pango.EllipsizeMode.END)
-            compact_label.set_hexpand(True)
-            
-            main_row.pack_start(compact_label, True, True, 0)
-            main_item.add(main_row)
-            
-            # Create submenu with detailed info
-            submenu = Gtk.Menu()
-            main_item.set_submenu(submenu)
-            
-            # Header with project name and status
-            header_item = Gtk.MenuItem(label=f"{status_emoji} {primary} — {dep.status}")
-            header_item.set_sensitive(False)
-            submenu.append(header_item)
-            
-            submenu.append(Gtk.SeparatorMenuItem())
-            
-            # Environment and branch info
-            if target or branch:
-                env_text = f"Environment: {target or 'unknown'}"
-                if branch:
-                    env_text += f" • Branch: {branch}"
-                env_item = Gtk.MenuItem(label=env_text)
-                env_item.set_sensitive(False)
-                submenu.append(env_item)
-            
-            # Commit info
-            if short_sha:
-                commit_text = f"Commit: {short_sha}"
-                if dep.commit_message:
-                    commit_text += f" • {dep.commit_message.strip()}"
-                commit_item = Gtk.MenuItem(label=commit_text)
-                commit_item.set_sensitive(False)
-                submenu.append(commit_item)
-            
-            # Author and time
-            author_text = f"Author: {author}" if author else "Author: unknown"
-            time_text = f"Deployed: {when}"
-            author_item = Gtk.MenuItem(label=author_text)
-            author_item.set_sensitive(False)
-            submenu.append(author_item)
-            
-            time_item = Gtk.MenuItem(label=time_text)
-            time_item.set_sensitive(False)
-            submenu.append(time_item)
-            
-            submenu.append(Gtk.SeparatorMenuItem())
-            
-            # Preview button (opens deployment URL)
-            if dep.url:
-                preview_item = Gtk.MenuItem(label="🔗 Preview")
-                def on_preview(_w: Gtk.MenuItem, d: Deployment = dep) -> None:
-                    webbrowser.open_new_tab(f"https://{d.url}" if not d.url.startswith("http") else d.url)
-                preview_item.connect("activate", on_preview)
-                submenu.append(preview_item)
-            
-            
-            # Insert after header keeping the original ordering
-            self.menu.insert(main_item, insert_index)
-            insert_index += 1
-
-        self.menu.show_all()
+        # Update pooled rows in place; only touch widgets whose content actually changed
+        visible = deployments[: self.max_items]
+        # Resolve "today" once so every row shares the same reference day
+        today = _dt.date.today()
+
+        # Shrink lazily: only drop rows beyond a lowered max_items limit
+        while len(self._row_pool) > self.max_items:
+            row = self._row_pool.pop()
+            self.menu.remove(row.menu_item)
+            row.menu_item.destroy()
+
+        for index, dep in enumerate(visible):
+            if index == len(self._row_pool):
+                row = self._create_row()
+                # Insert after header and any existing rows, keeping the original ordering
+                self.menu.insert(row.menu_item, self._dynamic_insert_position + index)
+                row.menu_item.show_all()
+                self._row_pool.append(row)
+            row = self._row_pool[index]
+
+            when = self._humanize_time(dep.created_at, today)
+            compact_text = self._compact_text(dep, when)
+            label_changed = row.compact_text != compact_text
+            if label_changed:
+                row.label.set_text(compact_text)
+                row.compact_text = compact_text
+            # The relative time also appears in the submenu, so refresh it when the label moved on
+            if row.deployment != dep or label_changed:
+                self._fill_submenu(row.submenu, dep, when)
+                row.deployment = dep
+            row.menu_item.show()
+
+        # Hide pooled rows that have nothing to show this time
+        for row in self._row_pool[len(visible) :]:
+            row.menu_item.hide()
+
+    def _create_row(self) -> _RowWidgets:
+        # Create main menu item with compact info
+        main_item = Gtk.MenuItem()
+        main_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        main_row.set_margin_start(6)
+        main_row.set_margin_end(6)
+        main_row.set_margin_top(2)
+        main_row.set_margin_bottom(2)
+
+        compact_label = Gtk.Label()
+        compact_label.set_xalign(0)
+        compact_label.set_ellipsize(Pango.EllipsizeMode.END)
+        compact_label.set_hexpand(True)
+
+        main_row.pack_start(compact_label, True, True, 0)
+        main_item.add(main_row)
+
+        # Submenu with detailed info, filled by _fill_submenu
+        submenu = Gtk.Menu()
+        main_item.set_submenu(submenu)
+        return _RowWidgets(menu_item=main_item, label=compact_label, submenu=submenu)
+
+    def _on_preview(self, _widget: Gtk.MenuItem, url: str) -> None:
+        webbrowser.open_new_tab(url if url.startswith("http") else f"https://{url}")
+
+    def _compact_text(self, dep: Deployment, when: str) -> str:
+        # Visual status hint using emoji for quick scanning
+        status_emoji = _STATUS_EMOJI[dep.status]
+        primary = dep.name or "(unknown)"
+        # Compact label: status + project + author + time
+        return f"{status_emoji} {primary} · {dep.author or ''} · {when}"
+
+    def _fill_submenu(self, submenu: Gtk.Menu, dep: Deployment, when: str) -> None:
+        for child in list(submenu.get_children()):
+            submenu.remove(child)
+            child.destroy()
+
+        status_emoji = _STATUS_EMOJI[dep.status]
+
+        branch = dep.branch or "?"
+        short_sha = dep.commit_sha[:7] if dep.commit_sha else ""
+        author = dep.author or ""
+        target = dep.target or ""
+        primary = dep.name or "(unknown)"
+
+        # Header with project name and status
+        header_item = Gtk.MenuItem(label=f"{status_emoji} {primary} — {dep.status.label}")
+        header_item.set_sensitive(False)
+        submenu.append(header_item)
+
+        submenu.append(Gtk.SeparatorMenuItem())
+
+        # Environment and branch info
+        if target or branch:
+            env_text = f"Environment: {target or 'unknown'}"
+            if branch:
+                env_text += f" • Branch: {branch}"
+            env_item = Gtk.MenuItem(label=env_text)
+            env_item.set_sensitive(False)
+            submenu.append(env_item)
+
+        # Commit info
+        if short_sha:
+            commit_text = f"Commit: {short_sha}"
+            if dep.commit_message:
+                commit_text += f" • {dep.commit_message.strip()}"
+            commit_item = Gtk.MenuItem(label=commit_text)
+            commit_item.set_sensitive(False)
+            submenu.append(commit_item)
+
+        # Author and time
+        author_text = f"Author: {author}" if author else "Author: unknown"
+        time_text = f"Deployed: {when}"
+        author_item = Gtk.MenuItem(label=author_text)
+        author_item.set_sensitive(False)
+        submenu.append(author_item)
+
+        time_item = Gtk.MenuItem(label=time_text)
+        time_item.set_sensitive(False)
+        submenu.append(time_item)
+
+        submenu.append(Gtk.SeparatorMenuItem())
+
+        # Preview button (opens deployment URL)
+        if dep.url:
+            preview_item = Gtk.MenuItem(label="🔗 Preview")
+            # Pass only the URL as signal user data; no per-row closure needed
+            preview_item.connect("activate", self._on_preview, dep.url)
+            submenu.append(preview_item)
+
+        submenu.show_all()
 
     # -------- Refresh logic --------
     def _set_icon_for_status(self, status: str) -> None:
@@ -216,93 +278,134 @@ class VercelIndicator:
         self.indicator.set_icon("vercel-menu-indicator-symbolic")
 
     def _overall_status(self, deployments: List[Deployment]) -> str:
-        if any(d.status == "building" for d in deployments):
-            return "building"
-        if any(d.status == "error" for d in deployments):
-            return "error"
-        return "ready"
+        # Single pass: collect the statuses present as a bitmask, then test by priority
+        mask = 0
+        for d in deployments:
+            mask |= 1 << d.status
+        if mask & (1 << Status.BUILDING):
+            return Status.BUILDING.label
+        if mask & (1 << Status.ERROR):
+            return Status.ERROR.label
+        return Status.READY.label
 
     def _manual_refresh(self, _widget: Gtk.MenuItem) -> None:
+        self._consecutive_unchanged = 0
         self._schedule_refresh(immediate=True)
 
+    def _effective_interval(self) -> int:
+        backoff = 2 ** min(self._consecutive_unchanged, _MAX_BACKOFF_STEPS)
+        backed_off = min(self.refresh_interval * backoff, _MAX_BACKOFF_INTERVAL)
+        return max(self.refresh_interval, backed_off)
+
     def _schedule_refresh(self, immediate: bool = False) -> None:
         if self._refresh_timer_id is not None:
             GLib.source_remove(self._refresh_timer_id)
             self._refresh_timer_id = None
 
         if immediate:
-            self._spawn_refresh_thread()
+            self._request_refresh()
 
         # Note: return True keeps the timeout repeating
-        self._refresh_timer_id = GLib.timeout_add_seconds(self.refresh_interval, self._refresh_timeout_cb)
+        self._refresh_timer_interval = self._effective_interval()
+        self._refresh_timer_id = GLib.timeout_add_seconds(
+            self._refresh_timer_interval, self._refresh_timeout_cb
+        )
 
     def _refresh_timeout_cb(self) -> bool:
-        self._spawn_refresh_thread()
+        self._request_refresh()
         return True
 
-    def _spawn_refresh_thread(self) -> None:
+    def _request_refresh(self) -> None:
         if self._refresh_in_progress:
             return
+        try:
+            self._refresh_q.put_nowait(True)
+        except queue.Full:
+            # A refresh is already pending; it will pick up the latest state
+            return
         self._refresh_in_progress = True
 
-        def worker() -> None:
+    def _refresh_worker(self) -> None:
+        while True:
+            cmd = self._refresh_q.get()
+            if cmd is None:
+                # Shutdown sentinel
+                return
             try:
                 deployments = self.client.list_deployments(limit=self.max_items)
             except Exception as exc:
                 deployments = []
                 # Show error state icon if request fails
                 GLib.idle_add(self._set_icon_for_status, "error")
-                Notify.Notification.new("Vercel", f"Failed to fetch deployments: {exc}", None).show()
+                # Notification D-Bus calls belong on the main loop, not this worker
+                GLib.idle_add(self._show_notification, f"Failed to fetch deployments: {exc}")
             GLib.idle_add(self._apply_update, deployments)
 
-        threading.Thread(target=worker, daemon=True).start()
-
     def _apply_update(self, deployments: List[Deployment]) -> None:
         self._refresh_in_progress = False
+        # Always run: unchanged rows only cost a string compare, and relative
+        # times ("today at ...") must still roll over after midnight
         self._rebuild_dynamic_items(deployments)
 
         overall = self._overall_status(deployments) if deployments else "error"
         self._set_icon_for_status(overall)
-        if overall != self._last_overall_status and self._last_overall_status is not None:
+        status_changed = overall != self._last_overall_status
+        if status_changed and self._last_overall_status is not None:
             # Notify on state change after first refresh
-            Notify.Notification.new("Vercel", f"Overall status: {overall}", None).show()
+            self._show_notification(f"Overall status: {overall}")
         self._last_overall_status = overall
 
         # Notify on production deployment events (new or status changes)
+        prod_events = False
         if self.notify_prod_events:
-            self._notify_production_events(deployments)
+            prod_events = self._notify_production_events(deployments)
+
+        # Back off while nothing happens; any change (or a running build) keeps the base interval
+        if status_changed or prod_events or overall == "building":
+            self._consecutive_unchanged = 0
+        else:
+            self._consecutive_unchanged += 1
+        if self._effective_interval() != self._refresh_timer_interval:
+            self._schedule_refresh()
 
     # -------- App lifecycle --------
     def _quit(self, _widget: Gtk.MenuItem) -> None:
+        try:
+            self._refresh_q.put_nowait(None)
+        except queue.Full:
+            # Worker is a daemon thread; it won't keep the process alive
+            pass
         Gtk.main_quit()
 
     # -------- Notifications for production deployments --------
-    def _notify_production_events(self, deployments: List[Deployment]) -> None:
+    def _notify_production_events(self, deployments: List[Deployment]) -> bool:
         # Bootstrap: on the very first refresh we only record state to avoid spamming
         production = [d for d in deployments if (d.target or "").lower() == "production"]
         if not self._prod_seen_bootstrapped:
             for d in production:
                 self._prod_seen[d.id] = d.status
             self._prod_seen_bootstrapped = True
-            return
-
-        for d in production:
-            previous = self._prod_seen.get(d.id)
-            if previous is None or previous != d.status:
+            return False
+
+        changes = [d for d in production if self._prod_seen.get(d.id) != d.status]
+        for d in changes:
+            self._prod_seen[d.id] = d.status
+        if len(changes) > _MAX_PROD_NOTIFICATIONS:
+            # e.g. right after enabling the app: one summary instead of a burst of popups
+            summary = " · ".join(f"{d.name} {_STATUS_EMOJI[d.status]}" for d in changes)
+            self._show_notification(f"{len(changes)} production deployments updated\n{summary}")
+        else:
+            for d in changes:
                 self._send_prod_notification(d)
-                self._prod_seen[d.id] = d.status
+        return bool(changes)
 
     def _send_prod_notification(self, d: Deployment) -> None:
         # Align notification details with the menu format for consistency.
-        status_emoji = {
-            "ready": "✅",
-            "building": "🟡",
-            "error": "❌",
-        }.get(d.status, "🟡")
+        status_emoji = _STATUS_EMOJI[d.status]
         short_sha = d.commit_sha[:7] if d.commit_sha else ""
         when = self._humanize_time(d.created_at)
         # First line: project, target and status
-        title = f"{d.name} — production — {d.status} {status_emoji}"
+        title = f"{d.name} — production — {d.status.label} {status_emoji}"
         # Second line: branch, sha, commit message (snippet), author, time
         msg = (d.commit_message or "").strip().splitlines()[0] if d.commit_message else ""
         if msg and len(msg) > 80:
@@ -318,27 +421,28 @@ class VercelIndicator:
             subtitle_bits.append(d.author)
         subtitle_bits.append(when)
         body = " · ".join(subtitle_bits) if subtitle_bits else "Production deployment event"
+        self._show_notification(f"{title}\n{body}")
+
+    def _show_notification(self, text: str) -> bool:
         try:
-            Notify.Notification.new("Vercel", f"{title}\n{body}", None).show()
+            Notify.Notification.new("Vercel", text, None).show()
         except Exception:
             pass
+        # Returning False removes the source when scheduled via GLib.idle_add
+        return False
 
     # -------- Helpers --------
-    def _humanize_time(self, dt_utc) -> str:
-        # Convert to local timezone
-        local = dt_utc.astimezone()
-        now = GLib.DateTime.new_now_local()
-        # Compare days
-        today = GLib.DateTime.new_now_local().format("%Y-%m-%d")
-        the_day = GLib.DateTime.new_from_unix_local(int(dt_utc.timestamp())).format("%Y-%m-%d")
-        if the_day == today:
-            return f"today at {dt_utc.astimezone().strftime('%H:%M')}"
-        # Yesterday check
-        y_dt = GLib.DateTime.new_now_local().add_days(-1)
-        yesterday = y_dt.format("%Y-%m-%d")
-        if the_day == yesterday:
-            return f"yesterday at {dt_utc.astimezone().strftime('%H:%M')}"
-        return dt_utc.astimezone().strftime("%b %d, %H:%M")
-
-
-
+    def _humanize_time(self, dt_utc: _dt.datetime, today: Optional[_dt.date] = None) -> str:
+        return _humanize_epoch(int(dt_utc.timestamp()), today or _dt.date.today())
+
+
+@functools.lru_cache(maxsize=256)
+def _humanize_epoch(epoch: int, today: _dt.date) -> str:
+    # Keyed on the current day too, so cached "today"/"yesterday" strings expire at midnight
+    local = _dt.datetime.fromtimestamp(epoch)
+    the_day = local.date()
+    if the_day == today:
+        return f"today at {local:%H:%M}"
+    if the_day == today - _dt.timedelta(days=1):
+        return f"yesterday at {local:%H:%M}"
+    return local.strftime("%b %d, %H:%M")
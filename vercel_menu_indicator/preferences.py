@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional
 
 import gi
 
@@ -13,7 +13,7 @@ from .config import load_config, save_config
 class PreferencesDialog(Gtk.Dialog):
     """Simple preferences dialog to edit token, team and refresh options."""
 
-    def __init__(self, on_save: Optional[Callable[[], None]] = None) -> None:
+    def __init__(self, on_save: Optional[Callable[[Dict[str, object]], None]] = None) -> None:
         super().__init__(title="Preferences")
         self.on_save = on_save
         self.set_default_size(420, 200)
@@ -81,7 +81,7 @@ class PreferencesDialog(Gtk.Dialog):
 
     def _on_response(self, _dialog: Gtk.Dialog, response_id: int) -> None:
         if response_id == Gtk.ResponseType.OK:
-            save_config(
+            cfg = save_config(
                 {
                     "token": self.entry_token.get_text().strip(),
                     "team_id": self.entry_team.get_text().strip(),
@@ -91,7 +91,7 @@ class PreferencesDialog(Gtk.Dialog):
                 }
             )
             if self.on_save:
-                self.on_save()
+                self.on_save(cfg)
         self.destroy()
 
 